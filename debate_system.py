@@ -1,85 +1,493 @@
 import os
+import sys
+import atexit
 import json
+import asyncio
+import hashlib
 import datetime
-from typing import List, Dict, Any
-from dataclasses import dataclass, asdict
+import threading
+import time
+import warnings
+from collections import Counter, defaultdict, deque
+from contextlib import contextmanager
+from typing import List, Dict, Any, Optional, Tuple
+from dataclasses import dataclass
+import httpx
+import orjson
+import tiktoken
 from crewai import Agent, Task, Crew, Process
 from crewai.tools import BaseTool
+from langchain_core.callbacks import BaseCallbackHandler
 from langchain_openai import ChatOpenAI
 
+# Per-round task descriptions; only {subject} and {context} change between rounds.
+# The fixed instructions come first so every prompt for an agent starts with the
+# same stable text, and only the tail varies from round to round.
+SKEPTIC_TASK_TMPL = """
+You must:
+1. Present a skeptical view of the debate topic below
+2. If responding to the optimist, directly challenge their points
+3. Use evidence and logic to support your position
+4. Include at least one mocking or dismissive comment about opposing views
+5. Keep response between 200-250 tokens
+
+Debate the topic: "{subject}"
+
+{context}
+"""
+
+OPTIMIST_TASK_TMPL = """
+You must:
+1. Present an optimistic view of the debate topic below
+2. Counter the skeptic's arguments with enthusiasm
+3. Use examples and positive evidence
+4. Include humor or light mockery of the skeptic's pessimism
+5. Keep response between 200-250 tokens
+
+Debate the topic: "{subject}"
+
+{context}
+"""
+
+SKEPTIC_EXPECTED_OUTPUT = "A skeptical argument with evidence and a dismissive comment"
+OPTIMIST_EXPECTED_OUTPUT = "An optimistic counter-argument with humor"
+
+def _load_ndjson(filename: str, loads=orjson.loads) -> List[Any]:
+    """Decode an append-only NDJSON file, repairing a final line cut short by a crash.
+
+    An undecodable last line is dropped with a warning and truncated from the file,
+    so the next append starts on a fresh line. Raises FileNotFoundError if the file
+    does not exist.
+    """
+    entries = []
+    with open(filename, 'rb+') as f:
+        offset = 0
+        line = b""
+        for line in f:
+            if line.strip():
+                try:
+                    entries.append(loads(line))
+                except ValueError:
+                    if f.read(1):
+                        raise  # Corruption before the last line is not a crash artefact
+                    warnings.warn(f"Dropping truncated last record in {filename}")
+                    f.truncate(offset)
+                    return entries
+            offset += len(line)
+        if line and not line.endswith(b"\n"):
+            f.write(b"\n")
+    return entries
+
 # Data structures for conversation recording
-@dataclass
+@dataclass(slots=True)
 class ConversationRecord:
     subject: str
-    timestamp: datetime.datetime
+    timestamp: float  # Unix epoch seconds
     agent_name: str
     response: str
     response_tokens: int
+    
+    @property
+    def dt(self) -> datetime.datetime:
+        """The timestamp as a local datetime"""
+        return datetime.datetime.fromtimestamp(self.timestamp)
 
 class ConversationRecorder:
-    def __init__(self, filename: str = "agent_conversations.json"):
+    def __init__(self, filename: str = "agent_conversations.ndjson",
+                 legacy_filename: str = "agent_conversations.json",
+                 flush_every: int = 10):
         self.filename = filename
+        self.legacy_filename = legacy_filename
         self.conversations: List[ConversationRecord] = []
+        # Records not yet written to file; written in one batch every flush_every records
+        self._pending: List[ConversationRecord] = []
+        self._flush_every = flush_every
+        # Serialization buffer reused by every flush; only grows, never shrinks
+        self._buf = bytearray(64 * 1024)
+        self._by_subject: Dict[str, List[ConversationRecord]] = defaultdict(list)
+        # Running aggregates so summaries don't rescan the history
+        self._agent_counts: Counter[Tuple[str, str]] = Counter()
+        self._token_totals: Counter[str] = Counter()
+        self._lock = threading.Lock()
         self.load_conversations()
+        atexit.register(self.flush)
+    
+    @staticmethod
+    def _to_record(record: Dict[str, Any]) -> ConversationRecord:
+        timestamp = record['timestamp']
+        if isinstance(timestamp, str):
+            # Files written before timestamps were stored as epoch seconds
+            timestamp = datetime.datetime.fromisoformat(timestamp).timestamp()
+        return ConversationRecord(
+            subject=record['subject'],
+            timestamp=timestamp,
+            agent_name=record['agent_name'],
+            response=record['response'],
+            response_tokens=record['response_tokens']
+        )
     
     def load_conversations(self):
-        """Load existing conversations from file"""
+        """Load existing conversations from file (one JSON record per line)"""
         try:
-            with open(self.filename, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                self.conversations = [
-                    ConversationRecord(
-                        subject=record['subject'],
-                        timestamp=datetime.datetime.fromisoformat(record['timestamp']),
-                        agent_name=record['agent_name'],
-                        response=record['response'],
-                        response_tokens=record['response_tokens']
-                    )
-                    for record in data
-                ]
+            self.conversations = [self._to_record(record) for record in _load_ndjson(self.filename)]
         except FileNotFoundError:
-            self.conversations = []
-    
-    def save_conversations(self):
-        """Save conversations to file"""
-        data = []
+            self.conversations = self._load_legacy_conversations()
+        
+        self._by_subject = defaultdict(list)
+        self._agent_counts = Counter()
+        self._token_totals = Counter()
         for record in self.conversations:
-            data.append({
-                'subject': record.subject,
-                'timestamp': record.timestamp.isoformat(),
-                'agent_name': record.agent_name,
-                'response': record.response,
-                'response_tokens': record.response_tokens
-            })
+            self._index(record)
+    
+    def _index(self, record: ConversationRecord):
+        self._by_subject[record.subject].append(record)
+        self._agent_counts[(record.subject, record.agent_name)] += 1
+        self._token_totals[record.subject] += record.response_tokens
+    
+    def _load_legacy_conversations(self) -> List[ConversationRecord]:
+        """Load conversations from the old single-array JSON file and migrate them"""
+        try:
+            with open(self.legacy_filename, 'rb') as f:
+                conversations = [self._to_record(record) for record in orjson.loads(f.read())]
+        except FileNotFoundError:
+            return []
+        
+        # Migrate once so later runs only ever append to the NDJSON file
+        with open(self.filename, 'wb') as f:
+            for record in conversations:
+                f.write(self._serialize(record))
+        return conversations
+    
+    @staticmethod
+    def _serialize(record: ConversationRecord) -> bytes:
+        return orjson.dumps({
+            'subject': record.subject,
+            'timestamp': record.timestamp,
+            'agent_name': record.agent_name,
+            'response': record.response,
+            'response_tokens': record.response_tokens
+        }, option=orjson.OPT_APPEND_NEWLINE)
+    
+    def _write_pending(self):
+        if not self._pending:
+            return
+        # Copy lines into the fixed-size buffer by slice assignment; truncating it
+        # instead (del buf[:]) would make CPython release the allocation
+        buf = self._buf
+        n = 0
+        for record in self._pending:
+            line = self._serialize(record)
+            end = n + len(line)
+            if end > len(buf):
+                buf.extend(bytes(max(end - len(buf), len(buf))))
+            buf[n:end] = line
+            n = end
         
-        with open(self.filename, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        with open(self.filename, 'ab') as f, memoryview(buf) as view:
+            f.write(view[:n])
+        self._pending.clear()
+    
+    def flush(self):
+        """Append all pending conversation records to file"""
+        with self._lock:
+            self._write_pending()
     
     def record_response(self, subject: str, agent_name: str, response: str, response_tokens: int):
         """Record an agent's response"""
         record = ConversationRecord(
             subject=subject,
-            timestamp=datetime.datetime.now(),
+            timestamp=time.time(),
             agent_name=agent_name,
             response=response,
             response_tokens=response_tokens
         )
-        self.conversations.append(record)
-        self.save_conversations()
+        with self._lock:
+            self.conversations.append(record)
+            self._index(record)
+            self._pending.append(record)
+            if len(self._pending) >= self._flush_every:
+                self._write_pending()
     
     def get_conversations_by_subject(self, subject: str) -> List[ConversationRecord]:
         """Get all conversations for a specific subject"""
-        return [conv for conv in self.conversations if conv.subject == subject]
+        return list(self._by_subject.get(subject, ()))
+    
+    def get_subject_stats(self, subject: str, offset: int = 0,
+                          limit: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """Get exchange counts, token totals and latest timestamp for a subject.
+
+        ``records`` holds the ``offset``/``limit`` page of the subject's records,
+        taken under the same lock so it agrees with the totals.
+        """
+        stop = None if limit is None else offset + limit
+        with self._lock:
+            records = self._by_subject.get(subject)
+            if not records:
+                return None
+            return {
+                "total_exchanges": len(records),
+                "skeptic_responses": self._agent_counts[(subject, "Skeptic")],
+                "optimist_responses": self._agent_counts[(subject, "Optimist")],
+                "total_tokens": self._token_totals[subject],
+                "latest_timestamp": records[-1].timestamp,
+                "records": records[offset:stop]
+            }
+
+class ResponseCache:
+    """Cache of agent responses keyed on everything that shapes the prompt.
+
+    Exact hits are looked up by a SHA-256 of the key. When sentence-transformers
+    is installed, prompts whose recent context is nearly identical are also
+    matched by cosine similarity of their embeddings, but only within the same
+    scope (subject, agent persona, task template and model settings).
+    """
+    
+    EMBEDDING_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+    
+    def __init__(self, filename: str = "llm_cache.ndjson", similarity_threshold: float = 0.92):
+        self.filename = filename
+        self.similarity_threshold = similarity_threshold
+        self._exact: Dict[str, str] = {}
+        # Parallel lists backing semantic lookup: (scope digest, context text, response)
+        self._scopes: List[str] = []
+        self._texts: List[str] = []
+        self._responses: List[str] = []
+        self._model = None
+        self._vectors = None  # numpy matrix of normalized embeddings, built lazily
+        self._lock = threading.Lock()
+        self.load_cache()
+    
+    @staticmethod
+    def make_key(subject: str, agent: Agent, llm: ChatOpenAI, template: str, expected_output: str,
+                 context: str) -> Dict[str, Any]:
+        """Build a cache key from the rendered task and everything else that shapes the answer.
+
+        The rendered task description is available as ``key["task"]``.
+        """
+        return {
+            "scope": {
+                "subj": subject,
+                "role": agent.role,
+                "goal": agent.goal,
+                "backstory": agent.backstory,
+                "template": template,
+                "expected_output": expected_output,
+                "model": llm.model_name,
+                "temperature": llm.temperature,
+                "max_tokens": llm.max_tokens
+            },
+            "task": template.format_map({'subject': subject, 'context': context}),
+            "ctx": context
+        }
+    
+    @staticmethod
+    def _digest(value: Any) -> str:
+        return hashlib.sha256(json.dumps(value, sort_keys=True, ensure_ascii=False).encode('utf-8')).hexdigest()
+    
+    def load_cache(self):
+        """Load cached responses from file"""
+        try:
+            entries = _load_ndjson(self.filename, json.loads)
+        except FileNotFoundError:
+            return
+        for entry in entries:
+            if 'scope' not in entry:
+                continue  # Written before keys covered the persona and prompt
+            self._add(entry['digest'], entry['scope'], entry['text'], entry['response'])
+    
+    def _add(self, digest: str, scope: str, text: str, response: str):
+        self._exact[digest] = response
+        self._scopes.append(scope)
+        self._texts.append(text)
+        self._responses.append(response)
+    
+    def _load_model(self):
+        """Lazily load the embedding model; returns None if it is unavailable"""
+        if self._model is None:
+            try:
+                from sentence_transformers import SentenceTransformer
+            except ImportError:
+                self._model = False
+            else:
+                self._model = SentenceTransformer(self.EMBEDDING_MODEL)
+        return self._model or None
+    
+    def _embed(self, texts: List[str]):
+        return self._model.encode(texts, normalize_embeddings=True)
+    
+    def _semantic_get(self, key: Dict[str, Any]) -> Optional[str]:
+        if not self._responses or self._load_model() is None:
+            return None
+        import numpy as np
+        
+        if self._vectors is None or len(self._vectors) < len(self._texts):
+            start = 0 if self._vectors is None else len(self._vectors)
+            new_vectors = self._embed(self._texts[start:])
+            self._vectors = new_vectors if self._vectors is None else np.vstack([self._vectors, new_vectors])
+        
+        query = self._embed([key["ctx"]])[0]
+        scores = self._vectors @ query
+        scores[np.asarray(self._scopes) != self._digest(key["scope"])] = -1.0
+        best = int(np.argmax(scores))
+        if scores[best] >= self.similarity_threshold:
+            return self._responses[best]
+        return None
+    
+    def get(self, key: Dict[str, Any]) -> Optional[str]:
+        """Return a cached response for the key, or None on a miss"""
+        response = self._exact.get(self._digest(key))
+        if response is not None:
+            return response
+        with self._lock:
+            return self._semantic_get(key)
+    
+    def put(self, key: Dict[str, Any], response: str):
+        """Store a response and append it to the cache file"""
+        digest = self._digest(key)
+        scope = self._digest(key["scope"])
+        text = key["ctx"]
+        line = json.dumps({
+            'digest': digest,
+            'scope': scope,
+            'text': text,
+            'response': response
+        }, ensure_ascii=False) + "\n"
+        with self._lock:
+            self._add(digest, scope, text, response)
+            with open(self.filename, 'a', encoding='utf-8') as f:
+                f.write(line)
+
+class StreamingOutputHandler(BaseCallbackHandler):
+    """Write LLM output to a stream while it is being generated.
+
+    Tokens are buffered per LLM call and written a line at a time, so concurrent
+    debates sharing one LLM do not interleave mid-line. Each line is prefixed
+    with the label set by ``labelled()`` on the calling thread.
+    """
+    
+    def __init__(self, stream=None):
+        self.stream = stream or sys.stdout
+        self._buffers: Dict[Any, Tuple[str, List[str]]] = {}
+        self._local = threading.local()
+        self._lock = threading.Lock()
+    
+    @contextmanager
+    def labelled(self, label: str):
+        """Prefix output of LLM calls made on this thread with ``[label]``"""
+        self._local.label = label
+        try:
+            yield
+        finally:
+            self._local.label = None
+    
+    def _write(self, prefix: str, text: str):
+        lines = "".join(f"{prefix}{line}\n" for line in text.split("\n"))
+        with self._lock:
+            self.stream.write(lines)
+            self.stream.flush()
+    
+    def on_llm_start(self, serialized: Dict[str, Any], prompts: List[str], *, run_id: Any = None,
+                     **kwargs: Any) -> None:
+        label = getattr(self._local, "label", None)
+        self._buffers[run_id] = (f"[{label}] " if label else "", [])
+    
+    def on_chat_model_start(self, serialized: Dict[str, Any], messages: List[Any], *, run_id: Any = None,
+                            **kwargs: Any) -> None:
+        self.on_llm_start(serialized, [], run_id=run_id)
+    
+    def on_llm_new_token(self, token: str, *, run_id: Any = None, **kwargs: Any) -> None:
+        prefix, buffer = self._buffers.setdefault(run_id, ("", []))
+        buffer.append(token)
+        if "\n" in token:
+            text = "".join(buffer)
+            complete, _, remainder = text.rpartition("\n")
+            self._write(prefix, complete)
+            buffer.clear()
+            if remainder:
+                buffer.append(remainder)
+    
+    def on_llm_end(self, response: Any, *, run_id: Any = None, **kwargs: Any) -> None:
+        prefix, buffer = self._buffers.pop(run_id, ("", []))
+        remainder = "".join(buffer)
+        if remainder:
+            self._write(prefix, remainder)
+    
+    def on_llm_error(self, error: BaseException, *, run_id: Any = None, **kwargs: Any) -> None:
+        self._buffers.pop(run_id, None)
+
+class CrewPool:
+    """Bounded free-list of single-task Crews reused across turns and debates.
+
+    A released Crew keeps its Task; acquiring it again only swaps the agent,
+    description and expected output instead of building new pydantic models.
+    """
+    
+    __slots__ = ('max_size', 'verbose', '_free', '_lock')
+    
+    def __init__(self, max_size: int = 4, verbose: bool = False):
+        self.max_size = max_size
+        self.verbose = verbose
+        self._free: List[Crew] = []
+        self._lock = threading.Lock()
+    
+    def acquire(self, agent: Agent, description: str, expected_output: str) -> Crew:
+        """Take a Crew from the pool (or build one) set up to run a single task"""
+        with self._lock:
+            crew = self._free.pop() if self._free else None
+        
+        if crew is None:
+            task = Task(description=description, agent=agent, expected_output=expected_output)
+            return Crew(agents=[agent], tasks=[task], process=Process.sequential, verbose=self.verbose)
+        
+        task = crew.tasks[0]
+        task.description = description
+        task.expected_output = expected_output
+        task.agent = agent
+        task.output = None
+        crew.agents = [agent]
+        return crew
+    
+    def release(self, crew: Crew):
+        """Return a Crew to the pool; it is dropped if the pool is full"""
+        with self._lock:
+            if len(self._free) < self.max_size:
+                self._free.append(crew)
+    
+    @contextmanager
+    def checkout(self, agent: Agent, description: str, expected_output: str):
+        crew = self.acquire(agent, description, expected_output)
+        try:
+            yield crew
+        finally:
+            self.release(crew)
 
 class DebateSystem:
-    def __init__(self, openai_api_key: str):
+    def __init__(self, openai_api_key: str, verbose: bool = False):
+        # Verbose mode logs CrewAI's agent steps and prints each turn as it happens
+        self._verbose = verbose
         self.recorder = ConversationRecorder()
+        self.cache = ResponseCache()
+        self.crew_pool = CrewPool(verbose=verbose)
+        self._stream_handler = StreamingOutputHandler()
+        # One pooled HTTP/2 client so every LLM call reuses the same TLS connection.
+        # langchain-openai 0.0.5 also hands this sync client to AsyncOpenAI, so the
+        # LLM is sync-only: don't call ainvoke/astream on it.
+        self._http = httpx.Client(
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=20, keepalive_expiry=300)
+        )
         self.llm = ChatOpenAI(
             model="gpt-3.5-turbo",  # Using fastest, cheapest model
             temperature=0.8,
             max_tokens=250,  # Limit tokens for cost control
-            openai_api_key=openai_api_key
+            openai_api_key=openai_api_key,
+            http_client=self._http,
+            # Must be set here: openai ignores the http_client's own timeout
+            request_timeout=60.0,
+            streaming=verbose  # Show output as it is generated instead of after the full completion
         )
+        # Loading the BPE table is slow, so do it once per system
+        self._enc = tiktoken.encoding_for_model(self.llm.model_name)
         
         # Agent personalities
         self.agent_personalities = {
@@ -104,70 +512,79 @@ class DebateSystem:
             }
         }
     
+    def close(self):
+        """Write pending conversation records and close the pooled HTTP connections"""
+        self.recorder.flush()
+        self._http.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
     def create_agents(self) -> tuple:
         """Create the two debating agents"""
+        skeptic = self.agent_personalities["skeptic"]
+        optimist = self.agent_personalities["optimist"]
+        # The stream handler goes on the agents, not the shared LLM: crewai's Agent
+        # validator replaces llm.callbacks wholesale with its own token counter
+        callbacks = [self._stream_handler] if self._verbose else []
+        
         skeptic_agent = Agent(
-            role=self.agent_personalities["skeptic"]["role"],
-            goal=self.agent_personalities["skeptic"]["goal"],
-            backstory=self.agent_personalities["skeptic"]["backstory"],
+            role=skeptic["role"],
+            goal=skeptic["goal"],
+            backstory=skeptic["backstory"],
             llm=self.llm,
-            verbose=True,
+            callbacks=callbacks,
+            verbose=self._verbose,
             allow_delegation=False
         )
         
         optimist_agent = Agent(
-            role=self.agent_personalities["optimist"]["role"],
-            goal=self.agent_personalities["optimist"]["goal"],
-            backstory=self.agent_personalities["optimist"]["backstory"],
+            role=optimist["role"],
+            goal=optimist["goal"],
+            backstory=optimist["backstory"],
             llm=self.llm,
-            verbose=True,
+            callbacks=callbacks,
+            verbose=self._verbose,
             allow_delegation=False
         )
         
         return skeptic_agent, optimist_agent
     
     def count_tokens(self, text: str) -> int:
-        """Simple token counting approximation"""
-        return len(text.split())
+        """Count tokens with the model's BPE encoding"""
+        return len(self._enc.encode(text, disallowed_special=()))
     
     def run_debate(self, subject: str, rounds: int = 3) -> List[Dict[str, Any]]:
         """Run a debate between the two agents on a given subject"""
+        subject = sys.intern(subject)
         skeptic_agent, optimist_agent = self.create_agents()
         
         debate_history = []
-        previous_responses = []
+        # Only the last two responses are ever fed back to the agents
+        previous_responses = deque(maxlen=2)
         
         for round_num in range(rounds):
-            print(f"\n=== ROUND {round_num + 1} ===")
+            if self._verbose:
+                print(f"\n=== {subject} - ROUND {round_num + 1} ===")
             
             # Skeptic's turn
-            context = f"Previous responses: {' '.join(previous_responses[-2:])}" if previous_responses else ""
-            skeptic_task = Task(
-                description=f"""
-                Debate the topic: "{subject}"
-                
-                {context}
-                
-                You must:
-                1. Present a skeptical view of "{subject}"
-                2. If responding to the optimist, directly challenge their points
-                3. Use evidence and logic to support your position
-                4. Include at least one mocking or dismissive comment about opposing views
-                5. Keep response between 200-250 tokens
-                """,
-                agent=skeptic_agent,
-                expected_output="A skeptical argument with evidence and a dismissive comment"
-            )
+            context = "Previous responses: " + " ".join(previous_responses) if previous_responses else ""
             
-            skeptic_crew = Crew(
-                agents=[skeptic_agent],
-                tasks=[skeptic_task],
-                process=Process.sequential,
-                verbose=True
+            skeptic_key = ResponseCache.make_key(
+                subject, skeptic_agent, self.llm, SKEPTIC_TASK_TMPL, SKEPTIC_EXPECTED_OUTPUT, context
             )
-            
-            skeptic_result = skeptic_crew.kickoff()
-            skeptic_response = str(skeptic_result)
+            skeptic_response = self.cache.get(skeptic_key)
+            if skeptic_response is None:
+                with self.crew_pool.checkout(
+                    skeptic_agent,
+                    skeptic_key["task"],
+                    SKEPTIC_EXPECTED_OUTPUT
+                ) as skeptic_crew, self._stream_handler.labelled(f"{subject} / Skeptic"):
+                    skeptic_response = str(skeptic_crew.kickoff())
+                self.cache.put(skeptic_key, skeptic_response)
             skeptic_tokens = self.count_tokens(skeptic_response)
             
             # Record skeptic's response
@@ -181,37 +598,24 @@ class DebateSystem:
                 "tokens": skeptic_tokens
             })
             
-            print(f"🤔 Skeptic: {skeptic_response}")
-            print(f"Tokens: {skeptic_tokens}")
+            if self._verbose:
+                print(f"[{subject}] 🤔 Skeptic: {skeptic_response}\nTokens: {skeptic_tokens}")
             
             # Optimist's turn
-            context = f"Previous responses: {' '.join(previous_responses[-2:])}"
-            optimist_task = Task(
-                description=f"""
-                Debate the topic: "{subject}"
-                
-                {context}
-                
-                You must:
-                1. Present an optimistic view of "{subject}"
-                2. Counter the skeptic's arguments with enthusiasm
-                3. Use examples and positive evidence
-                4. Include humor or light mockery of the skeptic's pessimism
-                5. Keep response between 200-250 tokens
-                """,
-                agent=optimist_agent,
-                expected_output="An optimistic counter-argument with humor"
-            )
+            context = "Previous responses: " + " ".join(previous_responses)
             
-            optimist_crew = Crew(
-                agents=[optimist_agent],
-                tasks=[optimist_task],
-                process=Process.sequential,
-                verbose=True
+            optimist_key = ResponseCache.make_key(
+                subject, optimist_agent, self.llm, OPTIMIST_TASK_TMPL, OPTIMIST_EXPECTED_OUTPUT, context
             )
-            
-            optimist_result = optimist_crew.kickoff()
-            optimist_response = str(optimist_result)
+            optimist_response = self.cache.get(optimist_key)
+            if optimist_response is None:
+                with self.crew_pool.checkout(
+                    optimist_agent,
+                    optimist_key["task"],
+                    OPTIMIST_EXPECTED_OUTPUT
+                ) as optimist_crew, self._stream_handler.labelled(f"{subject} / Optimist"):
+                    optimist_response = str(optimist_crew.kickoff())
+                self.cache.put(optimist_key, optimist_response)
             optimist_tokens = self.count_tokens(optimist_response)
             
             # Record optimist's response
@@ -225,38 +629,53 @@ class DebateSystem:
                 "tokens": optimist_tokens
             })
             
-            print(f"😊 Optimist: {optimist_response}")
-            print(f"Tokens: {optimist_tokens}")
+            if self._verbose:
+                print(f"[{subject}] 😊 Optimist: {optimist_response}\nTokens: {optimist_tokens}")
         
+        self.recorder.flush()
         return debate_history
     
-    def get_debate_summary(self, subject: str) -> Dict[str, Any]:
-        """Get a summary of all debates on a subject"""
-        conversations = self.recorder.get_conversations_by_subject(subject)
+    def get_debate_summary(self, subject: str, limit: Optional[int] = None, offset: int = 0,
+                           stats_only: bool = False) -> Dict[str, Any]:
+        """Get a summary of all debates on a subject.
+
+        Totals always cover every exchange; ``limit``/``offset`` only page the
+        ``conversations`` list in the result, which is omitted when ``stats_only``.
+        """
+        stats = self.recorder.get_subject_stats(subject, offset, 0 if stats_only else limit)
         
-        if not conversations:
+        if stats is None:
             return {"error": "No conversations found for this subject"}
         
-        skeptic_responses = [c for c in conversations if c.agent_name == "Skeptic"]
-        optimist_responses = [c for c in conversations if c.agent_name == "Optimist"]
-        
-        return {
+        summary = {
             "subject": subject,
-            "total_exchanges": len(conversations),
-            "skeptic_responses": len(skeptic_responses),
-            "optimist_responses": len(optimist_responses),
-            "total_tokens": sum(c.response_tokens for c in conversations),
-            "latest_debate": conversations[-1].timestamp.isoformat() if conversations else None,
-            "conversations": [
-                {
-                    "agent": c.agent_name,
-                    "response": c.response,
-                    "tokens": c.response_tokens,
-                    "timestamp": c.timestamp.isoformat()
-                }
-                for c in conversations
-            ]
+            "total_exchanges": stats["total_exchanges"],
+            "skeptic_responses": stats["skeptic_responses"],
+            "optimist_responses": stats["optimist_responses"],
+            "total_tokens": stats["total_tokens"],
+            "latest_debate": datetime.datetime.fromtimestamp(stats["latest_timestamp"]).isoformat()
         }
+        if stats_only:
+            return summary
+        
+        summary["conversations"] = [
+            {
+                "agent": c.agent_name,
+                "response": c.response,
+                "tokens": c.response_tokens,
+                "timestamp": c.dt.isoformat()
+            }
+            for c in stats["records"]
+        ]
+        return summary
+
+async def run_debates(debate_system: DebateSystem, subjects: List[str], rounds: int = 3) -> List[Any]:
+    """Run independent debates concurrently, one worker thread per subject.
+
+    Returns each subject's debate history, or the exception it raised.
+    """
+    tasks = [asyncio.to_thread(debate_system.run_debate, subject, rounds) for subject in subjects]
+    return await asyncio.gather(*tasks, return_exceptions=True)
 
 # Example usage and testing
 def main():
@@ -268,45 +687,44 @@ def main():
         return
     
     # Initialize the debate system
-    debate_system = DebateSystem(API_KEY)
-    
-    # Example subjects to debate
-    subjects = [
-        "Artificial Intelligence will replace human creativity",
-        "Remote work is better than office work",
-        "Social media has made society worse"
-    ]
-    
-    # Run debates
-    for subject in subjects:
+    with DebateSystem(API_KEY) as debate_system:
+        # Example subjects to debate
+        subjects = [
+            "Artificial Intelligence will replace human creativity",
+            "Remote work is better than office work",
+            "Social media has made society worse"
+        ]
+        
+        # Run debates (subjects are independent, so they run concurrently)
         print(f"\n{'='*60}")
-        print(f"STARTING DEBATE: {subject}")
+        print(f"STARTING DEBATES: {', '.join(subjects)}")
         print('='*60)
         
-        try:
-            debate_history = debate_system.run_debate(subject, rounds=10)
+        results = asyncio.run(run_debates(debate_system, subjects, rounds=10))
+        
+        for subject, result in zip(subjects, results):
+            if isinstance(result, Exception):
+                print(f"Error in debate '{subject}': {result}")
+                continue
             
             # Print summary
-            summary = debate_system.get_debate_summary(subject)
+            summary = debate_system.get_debate_summary(subject, stats_only=True)
             print(f"\n--- DEBATE SUMMARY ---")
             print(f"Subject: {summary['subject']}")
             print(f"Total exchanges: {summary['total_exchanges']}")
             print(f"Total tokens used: {summary['total_tokens']}")
-            
-        except Exception as e:
-            print(f"Error in debate: {e}")
-    
-    # Show all recorded conversations
-    print("\n" + "="*60)
-    print("ALL RECORDED CONVERSATIONS")
-    print("="*60)
-    
-    for subject in subjects:
-        summary = debate_system.get_debate_summary(subject)
-        if "error" not in summary:
-            print(f"\nSubject: {subject}")
-            for conv in summary["conversations"]:
-                print(f"  {conv['agent']} ({conv['tokens']} tokens): {conv['response'][:100]}...")
+        
+        # Show all recorded conversations
+        print("\n" + "="*60)
+        print("ALL RECORDED CONVERSATIONS")
+        print("="*60)
+        
+        for subject in subjects:
+            summary = debate_system.get_debate_summary(subject)
+            if "error" not in summary:
+                print(f"\nSubject: {subject}")
+                for conv in summary["conversations"]:
+                    print(f"  {conv['agent']} ({conv['tokens']} tokens): {conv['response'][:100]}...")
 
 if __name__ == "__main__":
     main()